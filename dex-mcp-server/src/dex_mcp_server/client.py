@@ -1,14 +1,48 @@
 """Dex CRM API client."""
 
+import asyncio
 import httpx
+import orjson
+from cachetools import TTLCache
+from datetime import datetime, timezone
 from typing import Any
 
+_UTC = timezone.utc
+
 
 class DexClient:
     """Client for interacting with the Dex CRM API."""
 
+    __slots__ = ("api_key", "_client", "_cache", "_generation", "_inflight")
+
     BASE_URL = "https://api.getdex.com/api/rest"
 
+    # Per-resource path templates
+    _CONTACT_BY_ID = "/contacts/%s"
+    _NOTE_BY_ID = "/timeline_items/%s"
+    _NOTES_FOR_CONTACT = "/timeline_items/contacts/%s"
+    _REMINDER_BY_ID = "/reminders/%s"
+
+    # Paginated list paths with a prebuilt querystring
+    _CONTACTS_PAGE = "/contacts?limit=%d&offset=%d"
+    _NOTES_PAGE = "/timeline_items?limit=%d&offset=%d"
+    _REMINDERS_PAGE = "/reminders?limit=%d&offset=%d"
+
+    # Connection pool sizing for the shared HTTP/2 client
+    MAX_CONNECTIONS = 100
+    MAX_KEEPALIVE_CONNECTIONS = 20
+    KEEPALIVE_EXPIRY = 60.0
+
+    # Maximum number of requests issued concurrently by bulk()
+    BULK_CONCURRENCY = 20
+
+    # Short-lived cache for read-only GET responses
+    CACHE_MAXSIZE = 1024
+    CACHE_TTL = 30.0
+
+    # Timeout for the best-effort connection warm-up request
+    WARMUP_TIMEOUT = 3.0
+
     def __init__(self, api_key: str):
         """Initialize the Dex client with an API key.
 
@@ -18,17 +52,53 @@ class DexClient:
         self.api_key = api_key
         self._client = httpx.AsyncClient(
             base_url=self.BASE_URL,
-            headers={
+            headers=httpx.Headers({
+                "Accept": "application/json",
                 "Content-Type": "application/json",
                 "x-hasura-dex-api-key": api_key,
-            },
+            }),
             timeout=30.0,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+                    max_connections=self.MAX_CONNECTIONS,
+                    keepalive_expiry=self.KEEPALIVE_EXPIRY,
+                ),
+                retries=1,
+            ),
         )
+        self._cache: TTLCache = TTLCache(
+            maxsize=self.CACHE_MAXSIZE, ttl=self.CACHE_TTL
+        )
+        # Bumped on every write so reads that overlap one are not cached
+        self._generation = 0
+        self._inflight: dict[tuple, asyncio.Task] = {}
 
     async def close(self):
         """Close the HTTP client."""
         await self._client.aclose()
 
+    async def warmup(self) -> None:
+        """Open a pooled connection ahead of the first real request.
+
+        Failures are ignored; the next request simply connects as usual.
+        """
+        try:
+            await self._client.get(
+                "/contacts", params={"limit": 1}, timeout=self.WARMUP_TIMEOUT
+            )
+        except httpx.HTTPError:
+            pass
+
+    async def __aenter__(self) -> "DexClient":
+        """Enter the async context, returning the client itself."""
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close the HTTP client on context exit."""
+        await self.close()
+
     async def _request(
         self,
         method: str,
@@ -36,10 +106,131 @@ class DexClient:
         params: dict[str, Any] | None = None,
         json: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        """Make an API request."""
-        response = await self._client.request(method, path, params=params, json=json)
-        response.raise_for_status()
-        return response.json()
+        """Make an API request.
+
+        Concurrent identical GET requests share a single in-flight request.
+        """
+        if method != "GET":
+            return await self._send(method, path, params, json)
+
+        # Requests started after a write must not join one started before it
+        key = (self._generation, *self._request_key(path, params))
+        task = self._inflight.get(key)
+        if task is None:
+            # Run the request in its own task so cancelling any one caller,
+            # including the first, leaves it running for the others
+            task = asyncio.ensure_future(self._send(method, path, params, json))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._request_done(key, t))
+        return await asyncio.shield(task)
+
+    def _request_done(self, key: tuple, task: asyncio.Task) -> None:
+        """Forget a finished shared GET request."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark retrieved in case every caller was cancelled
+            task.exception()
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Send a single HTTP request and decode the JSON response."""
+        if method == "GET":
+            response = await self._client.request(method, path, params=params)
+        else:
+            # Encode bodies with orjson; Content-Type is set on the client
+            content = orjson.dumps(json) if json is not None else None
+            try:
+                response = await self._client.request(
+                    method, path, params=params, content=content
+                )
+            finally:
+                # Any write, even a failed one, may change what reads return
+                self._generation += 1
+                self._cache.clear()
+        status_code = response.status_code
+        # Like raise_for_status(): redirects are not followed, so any
+        # non-2xx response is an error
+        if not 200 <= status_code < 300:
+            raise httpx.HTTPStatusError(
+                f"HTTP {status_code} for url '{response.url}'",
+                request=response.request,
+                response=response,
+            )
+        return orjson.loads(response.content)
+
+    @staticmethod
+    def _request_key(
+        path: str, params: dict[str, Any] | None
+    ) -> tuple[str, str]:
+        """Build a hashable key identifying a GET request."""
+        return (path, str(httpx.QueryParams(params)) if params else "")
+
+    async def _cached_get(
+        self, path: str, params: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Make a GET request, serving repeats from the TTL cache."""
+        key = self._request_key(path, params)
+        result = self._cache.get(key)
+        if result is None:
+            generation = self._generation
+            result = await self._request("GET", path, params=params)
+            if self._generation == generation:
+                self._cache[key] = result
+        return result
+
+    @staticmethod
+    def _is_api_path(path: str) -> bool:
+        """Check that a path stays under BASE_URL once joined onto it.
+
+        An absolute URL would replace base_url, and '.'/'..' segments (even
+        percent-encoded) could climb out of it; either way the API key would
+        be sent somewhere other than the Dex REST API.
+        """
+        url = httpx.URL(path)
+        if not path.startswith("/") or not url.is_relative_url or url.host:
+            return False
+        return not any(segment in (".", "..") for segment in url.path.split("/"))
+
+    async def bulk(
+        self,
+        calls: list[
+            tuple[str, str, dict[str, Any] | None, dict[str, Any] | None]
+        ],
+    ) -> list[dict[str, Any] | BaseException]:
+        """Issue several independent API requests concurrently.
+
+        Args:
+            calls: List of (method, path, params, json) tuples, one per request
+
+        Returns:
+            Results in the same order as calls; a failed request yields its
+            exception instead of a response. Paths that are not relative to
+            BASE_URL, and GET requests with a JSON body, are rejected with
+            ValueError.
+        """
+        semaphore = asyncio.Semaphore(self.BULK_CONCURRENCY)
+
+        async def run(
+            call: tuple[str, str, dict[str, Any] | None, dict[str, Any] | None],
+        ) -> dict[str, Any]:
+            method, path, _, body = call
+            # GETs are coalesced without regard to the body, so refuse one
+            if method == "GET" and body is not None:
+                raise ValueError(f"GET requests cannot have a JSON body: {path!r}")
+            if not self._is_api_path(path):
+                raise ValueError(f"Path must be relative to the API: {path!r}")
+            async with semaphore:
+                return await self._request(*call)
+
+        return await asyncio.gather(
+            *(run(call) for call in calls), return_exceptions=True
+        )
 
     # -------------------------------------------------------------------------
     # Contacts
@@ -57,8 +248,8 @@ class DexClient:
         Returns:
             Dictionary with 'contacts' list and 'pagination' info
         """
-        return await self._request(
-            "GET", "/contacts", params={"limit": limit, "offset": offset}
+        return await self._cached_get(
+            self._CONTACTS_PAGE % (int(limit), int(offset))
         )
 
     async def get_contact(self, contact_id: str) -> dict[str, Any]:
@@ -70,7 +261,7 @@ class DexClient:
         Returns:
             Contact details
         """
-        return await self._request("GET", f"/contacts/{contact_id}")
+        return await self._cached_get(self._CONTACT_BY_ID % contact_id)
 
     async def search_contacts_by_email(self, email: str) -> dict[str, Any]:
         """Search for contacts by email address.
@@ -81,8 +272,8 @@ class DexClient:
         Returns:
             Matching contacts
         """
-        return await self._request(
-            "GET", "/search/contacts", params={"email": email}
+        return await self._cached_get(
+            "/search/contacts", params={"email": email}
         )
 
     async def create_contact(
@@ -117,7 +308,7 @@ class DexClient:
         Returns:
             Created contact details
         """
-        contact_data: dict[str, Any] = {
+        fields: dict[str, Any] = {
             "first_name": first_name,
             "last_name": last_name,
             "job_title": job_title,
@@ -127,6 +318,7 @@ class DexClient:
             "instagram": instagram,
             "website": website,
         }
+        contact_data = {k: v for k, v in fields.items() if v is not None}
 
         if email:
             contact_data["contact_emails"] = {"data": {"email": email}}
@@ -145,13 +337,15 @@ class DexClient:
 
         Args:
             contact_id: The UUID of the contact to update
-            **fields: Fields to update (first_name, last_name, job_title, etc.)
+            **fields: Fields to update (first_name, last_name, job_title, etc.);
+                fields set to None are omitted
 
         Returns:
             Updated contact details
         """
+        fields = {k: v for k, v in fields.items() if v is not None}
         return await self._request(
-            "PUT", f"/contacts/{contact_id}", json={"contact": fields}
+            "PUT", self._CONTACT_BY_ID % contact_id, json={"contact": fields}
         )
 
     async def delete_contact(self, contact_id: str) -> dict[str, Any]:
@@ -163,7 +357,24 @@ class DexClient:
         Returns:
             Deletion confirmation
         """
-        return await self._request("DELETE", f"/contacts/{contact_id}")
+        return await self._request("DELETE", self._CONTACT_BY_ID % contact_id)
+
+    async def delete_contacts_bulk(
+        self, contact_ids: list[str]
+    ) -> list[dict[str, Any] | BaseException]:
+        """Delete several contacts concurrently.
+
+        Args:
+            contact_ids: The UUIDs of the contacts to delete
+
+        Returns:
+            Deletion confirmations in the same order as contact_ids; a failed
+            deletion yields its exception instead
+        """
+        return await self.bulk([
+            ("DELETE", self._CONTACT_BY_ID % contact_id, None, None)
+            for contact_id in contact_ids
+        ])
 
     # -------------------------------------------------------------------------
     # Notes (Timeline Items)
@@ -181,8 +392,8 @@ class DexClient:
         Returns:
             Dictionary with 'timeline_items' list and 'pagination' info
         """
-        return await self._request(
-            "GET", "/timeline_items", params={"limit": limit, "offset": offset}
+        return await self._cached_get(
+            self._NOTES_PAGE % (int(limit), int(offset))
         )
 
     async def get_notes_for_contact(self, contact_id: str) -> dict[str, Any]:
@@ -194,7 +405,7 @@ class DexClient:
         Returns:
             Notes associated with the contact
         """
-        return await self._request("GET", f"/timeline_items/contacts/{contact_id}")
+        return await self._cached_get(self._NOTES_FOR_CONTACT % contact_id)
 
     async def create_note(
         self,
@@ -212,10 +423,8 @@ class DexClient:
         Returns:
             Created note details
         """
-        from datetime import datetime, timezone
-
         if event_time is None:
-            event_time = datetime.now(timezone.utc).isoformat()
+            event_time = datetime.now(_UTC).isoformat()
 
         timeline_event = {
             "note": note,
@@ -243,7 +452,7 @@ class DexClient:
             Updated note details
         """
         return await self._request(
-            "PUT", f"/timeline_items/{note_id}", json={"timeline_event": {"note": note}}
+            "PUT", self._NOTE_BY_ID % note_id, json={"timeline_event": {"note": note}}
         )
 
     async def delete_note(self, note_id: str) -> dict[str, Any]:
@@ -255,7 +464,24 @@ class DexClient:
         Returns:
             Deletion confirmation
         """
-        return await self._request("DELETE", f"/timeline_items/{note_id}")
+        return await self._request("DELETE", self._NOTE_BY_ID % note_id)
+
+    async def delete_notes_bulk(
+        self, note_ids: list[str]
+    ) -> list[dict[str, Any] | BaseException]:
+        """Delete several notes concurrently.
+
+        Args:
+            note_ids: The UUIDs of the notes to delete
+
+        Returns:
+            Deletion confirmations in the same order as note_ids; a failed
+            deletion yields its exception instead
+        """
+        return await self.bulk([
+            ("DELETE", self._NOTE_BY_ID % note_id, None, None)
+            for note_id in note_ids
+        ])
 
     # -------------------------------------------------------------------------
     # Reminders
@@ -273,8 +499,8 @@ class DexClient:
         Returns:
             Dictionary with 'reminders' list and total count
         """
-        return await self._request(
-            "GET", "/reminders", params={"limit": limit, "offset": offset}
+        return await self._cached_get(
+            self._REMINDERS_PAGE % (int(limit), int(offset))
         )
 
     async def create_reminder(
@@ -344,7 +570,7 @@ class DexClient:
             reminder_data["is_complete"] = is_complete
 
         return await self._request(
-            "PUT", f"/reminders/{reminder_id}", json={"reminder": reminder_data}
+            "PUT", self._REMINDER_BY_ID % reminder_id, json={"reminder": reminder_data}
         )
 
     async def delete_reminder(self, reminder_id: str) -> dict[str, Any]:
@@ -356,7 +582,24 @@ class DexClient:
         Returns:
             Deletion confirmation
         """
-        return await self._request("DELETE", f"/reminders/{reminder_id}")
+        return await self._request("DELETE", self._REMINDER_BY_ID % reminder_id)
+
+    async def delete_reminders_bulk(
+        self, reminder_ids: list[str]
+    ) -> list[dict[str, Any] | BaseException]:
+        """Delete several reminders concurrently.
+
+        Args:
+            reminder_ids: The UUIDs of the reminders to delete
+
+        Returns:
+            Deletion confirmations in the same order as reminder_ids; a failed
+            deletion yields its exception instead
+        """
+        return await self.bulk([
+            ("DELETE", self._REMINDER_BY_ID % reminder_id, None, None)
+            for reminder_id in reminder_ids
+        ])
 
     async def complete_reminder(self, reminder_id: str) -> dict[str, Any]:
         """Mark a reminder as complete.
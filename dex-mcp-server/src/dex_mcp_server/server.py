@@ -1,7 +1,12 @@
 """Dex CRM MCP Server - Access contacts, notes, and reminders via MCP."""
 
+import asyncio
 import os
-import json
+import httpx
+import orjson
+from collections.abc import Awaitable, Callable
+from functools import partial
+from typing import Any
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
@@ -14,6 +19,9 @@ server = Server("dex-mcp-server")
 # Global client instance (initialized on first use)
 _client: DexClient | None = None
 
+# Tool dispatch table bound to _client (initialized on first use)
+_dispatch: dict[str, Callable[[dict], Awaitable[Any]]] | None = None
+
 
 def get_client() -> DexClient:
     """Get or create the Dex client."""
@@ -29,473 +37,643 @@ def get_client() -> DexClient:
     return _client
 
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available Dex CRM tools."""
-    return [
-        # Contacts
-        Tool(
-            name="dex_list_contacts",
-            description="List all contacts from Dex CRM with pagination. Returns contact details including name, email, phone, job title, and social profiles.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of contacts to return (default: 10, max: 100)",
-                        "default": 10,
-                    },
-                    "offset": {
-                        "type": "integer",
-                        "description": "Number of contacts to skip for pagination (default: 0)",
-                        "default": 0,
-                    },
+# Tool definitions are static, so build them once at import time
+_TOOLS: list[Tool] = [
+    # Contacts
+    Tool(
+        name="dex_list_contacts",
+        description="List all contacts from Dex CRM with pagination. Returns contact details including name, email, phone, job title, and social profiles.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of contacts to return (default: 10, max: 100)",
+                    "default": 10,
+                },
+                "offset": {
+                    "type": "integer",
+                    "description": "Number of contacts to skip for pagination (default: 0)",
+                    "default": 0,
                 },
             },
-        ),
-        Tool(
-            name="dex_get_contact",
-            description="Get detailed information about a specific contact by their ID.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "contact_id": {
-                        "type": "string",
-                        "description": "The UUID of the contact to retrieve",
-                    },
+        },
+    ),
+    Tool(
+        name="dex_get_contact",
+        description="Get detailed information about a specific contact by their ID.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "contact_id": {
+                    "type": "string",
+                    "description": "The UUID of the contact to retrieve",
                 },
-                "required": ["contact_id"],
             },
-        ),
-        Tool(
-            name="dex_search_contacts",
-            description="Search for contacts by email address.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "email": {
-                        "type": "string",
-                        "description": "Email address to search for",
-                    },
+            "required": ["contact_id"],
+        },
+    ),
+    Tool(
+        name="dex_search_contacts",
+        description="Search for contacts by email address.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "email": {
+                    "type": "string",
+                    "description": "Email address to search for",
                 },
-                "required": ["email"],
             },
-        ),
-        Tool(
-            name="dex_create_contact",
-            description="Create a new contact in Dex CRM.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "first_name": {
-                        "type": "string",
-                        "description": "Contact's first name",
-                    },
-                    "last_name": {
-                        "type": "string",
-                        "description": "Contact's last name",
-                    },
-                    "email": {
-                        "type": "string",
-                        "description": "Contact's email address",
-                    },
-                    "phone": {
-                        "type": "string",
-                        "description": "Contact's phone number",
-                    },
-                    "phone_label": {
-                        "type": "string",
-                        "description": "Label for phone number (e.g., 'Work', 'Mobile')",
-                        "default": "Work",
-                    },
-                    "job_title": {
-                        "type": "string",
-                        "description": "Contact's job title",
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Notes about the contact",
-                    },
-                    "linkedin": {
-                        "type": "string",
-                        "description": "LinkedIn username",
-                    },
-                    "twitter": {
-                        "type": "string",
-                        "description": "Twitter handle",
-                    },
-                    "instagram": {
-                        "type": "string",
-                        "description": "Instagram username",
-                    },
-                    "website": {
-                        "type": "string",
-                        "description": "Personal website URL",
-                    },
+            "required": ["email"],
+        },
+    ),
+    Tool(
+        name="dex_create_contact",
+        description="Create a new contact in Dex CRM.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "first_name": {
+                    "type": "string",
+                    "description": "Contact's first name",
+                },
+                "last_name": {
+                    "type": "string",
+                    "description": "Contact's last name",
+                },
+                "email": {
+                    "type": "string",
+                    "description": "Contact's email address",
+                },
+                "phone": {
+                    "type": "string",
+                    "description": "Contact's phone number",
+                },
+                "phone_label": {
+                    "type": "string",
+                    "description": "Label for phone number (e.g., 'Work', 'Mobile')",
+                    "default": "Work",
+                },
+                "job_title": {
+                    "type": "string",
+                    "description": "Contact's job title",
+                },
+                "description": {
+                    "type": "string",
+                    "description": "Notes about the contact",
+                },
+                "linkedin": {
+                    "type": "string",
+                    "description": "LinkedIn username",
+                },
+                "twitter": {
+                    "type": "string",
+                    "description": "Twitter handle",
+                },
+                "instagram": {
+                    "type": "string",
+                    "description": "Instagram username",
+                },
+                "website": {
+                    "type": "string",
+                    "description": "Personal website URL",
                 },
-                "required": ["first_name", "last_name"],
             },
-        ),
-        Tool(
-            name="dex_update_contact",
-            description="Update an existing contact's information.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "contact_id": {
-                        "type": "string",
-                        "description": "The UUID of the contact to update",
-                    },
-                    "first_name": {
-                        "type": "string",
-                        "description": "New first name",
-                    },
-                    "last_name": {
-                        "type": "string",
-                        "description": "New last name",
-                    },
-                    "job_title": {
-                        "type": "string",
-                        "description": "New job title",
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "New description/notes",
-                    },
-                    "linkedin": {
-                        "type": "string",
-                        "description": "New LinkedIn username",
-                    },
-                    "twitter": {
-                        "type": "string",
-                        "description": "New Twitter handle",
-                    },
-                    "instagram": {
-                        "type": "string",
-                        "description": "New Instagram username",
-                    },
-                    "website": {
-                        "type": "string",
-                        "description": "New website URL",
-                    },
+            "required": ["first_name", "last_name"],
+        },
+    ),
+    Tool(
+        name="dex_update_contact",
+        description="Update an existing contact's information.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "contact_id": {
+                    "type": "string",
+                    "description": "The UUID of the contact to update",
+                },
+                "first_name": {
+                    "type": "string",
+                    "description": "New first name",
+                },
+                "last_name": {
+                    "type": "string",
+                    "description": "New last name",
+                },
+                "job_title": {
+                    "type": "string",
+                    "description": "New job title",
+                },
+                "description": {
+                    "type": "string",
+                    "description": "New description/notes",
+                },
+                "linkedin": {
+                    "type": "string",
+                    "description": "New LinkedIn username",
+                },
+                "twitter": {
+                    "type": "string",
+                    "description": "New Twitter handle",
+                },
+                "instagram": {
+                    "type": "string",
+                    "description": "New Instagram username",
+                },
+                "website": {
+                    "type": "string",
+                    "description": "New website URL",
                 },
-                "required": ["contact_id"],
             },
-        ),
-        Tool(
-            name="dex_delete_contact",
-            description="Delete a contact from Dex CRM.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "contact_id": {
-                        "type": "string",
-                        "description": "The UUID of the contact to delete",
-                    },
+            "required": ["contact_id"],
+        },
+    ),
+    Tool(
+        name="dex_delete_contact",
+        description="Delete a contact from Dex CRM.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "contact_id": {
+                    "type": "string",
+                    "description": "The UUID of the contact to delete",
                 },
-                "required": ["contact_id"],
             },
-        ),
-        # Notes
-        Tool(
-            name="dex_list_notes",
-            description="List all notes from Dex CRM with pagination. Notes are timeline items that can be associated with contacts.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of notes to return (default: 10)",
-                        "default": 10,
-                    },
-                    "offset": {
-                        "type": "integer",
-                        "description": "Number of notes to skip for pagination (default: 0)",
-                        "default": 0,
-                    },
+            "required": ["contact_id"],
+        },
+    ),
+    Tool(
+        name="dex_bulk_delete_contacts",
+        description="Delete several contacts from Dex CRM in one call.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "contact_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of contact UUIDs to delete",
                 },
             },
-        ),
-        Tool(
-            name="dex_get_notes_for_contact",
-            description="Get all notes associated with a specific contact.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "contact_id": {
-                        "type": "string",
-                        "description": "The UUID of the contact to get notes for",
-                    },
+            "required": ["contact_ids"],
+        },
+    ),
+    # Notes
+    Tool(
+        name="dex_list_notes",
+        description="List all notes from Dex CRM with pagination. Notes are timeline items that can be associated with contacts.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of notes to return (default: 10)",
+                    "default": 10,
+                },
+                "offset": {
+                    "type": "integer",
+                    "description": "Number of notes to skip for pagination (default: 0)",
+                    "default": 0,
                 },
-                "required": ["contact_id"],
             },
-        ),
-        Tool(
-            name="dex_create_note",
-            description="Create a new note and associate it with one or more contacts.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "note": {
-                        "type": "string",
-                        "description": "The note content",
-                    },
-                    "contact_ids": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of contact UUIDs to associate with this note",
-                    },
-                    "event_time": {
-                        "type": "string",
-                        "description": "ISO 8601 timestamp for the note (defaults to now)",
-                    },
+        },
+    ),
+    Tool(
+        name="dex_get_notes_for_contact",
+        description="Get all notes associated with a specific contact.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "contact_id": {
+                    "type": "string",
+                    "description": "The UUID of the contact to get notes for",
                 },
-                "required": ["note", "contact_ids"],
             },
-        ),
-        Tool(
-            name="dex_update_note",
-            description="Update the content of an existing note.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "note_id": {
-                        "type": "string",
-                        "description": "The UUID of the note to update",
-                    },
-                    "note": {
-                        "type": "string",
-                        "description": "New note content",
-                    },
+            "required": ["contact_id"],
+        },
+    ),
+    Tool(
+        name="dex_create_note",
+        description="Create a new note and associate it with one or more contacts.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "note": {
+                    "type": "string",
+                    "description": "The note content",
+                },
+                "contact_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of contact UUIDs to associate with this note",
+                },
+                "event_time": {
+                    "type": "string",
+                    "description": "ISO 8601 timestamp for the note (defaults to now)",
                 },
-                "required": ["note_id", "note"],
             },
-        ),
-        Tool(
-            name="dex_delete_note",
-            description="Delete a note from Dex CRM.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "note_id": {
-                        "type": "string",
-                        "description": "The UUID of the note to delete",
-                    },
+            "required": ["note", "contact_ids"],
+        },
+    ),
+    Tool(
+        name="dex_update_note",
+        description="Update the content of an existing note.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "note_id": {
+                    "type": "string",
+                    "description": "The UUID of the note to update",
+                },
+                "note": {
+                    "type": "string",
+                    "description": "New note content",
                 },
-                "required": ["note_id"],
             },
-        ),
-        # Reminders
-        Tool(
-            name="dex_list_reminders",
-            description="List all reminders from Dex CRM with pagination. Reminders can be associated with contacts and have due dates.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of reminders to return (default: 10)",
-                        "default": 10,
-                    },
-                    "offset": {
-                        "type": "integer",
-                        "description": "Number of reminders to skip for pagination (default: 0)",
-                        "default": 0,
-                    },
+            "required": ["note_id", "note"],
+        },
+    ),
+    Tool(
+        name="dex_delete_note",
+        description="Delete a note from Dex CRM.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "note_id": {
+                    "type": "string",
+                    "description": "The UUID of the note to delete",
                 },
             },
-        ),
-        Tool(
-            name="dex_create_reminder",
-            description="Create a new reminder, optionally associated with contacts.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {
-                        "type": "string",
-                        "description": "Reminder title",
-                    },
-                    "due_date": {
-                        "type": "string",
-                        "description": "Due date in YYYY-MM-DD format",
-                    },
-                    "contact_ids": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of contact UUIDs to associate with this reminder",
-                    },
-                    "text": {
-                        "type": "string",
-                        "description": "Additional reminder details",
-                    },
+            "required": ["note_id"],
+        },
+    ),
+    Tool(
+        name="dex_bulk_delete_notes",
+        description="Delete several notes from Dex CRM in one call.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "note_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of note UUIDs to delete",
                 },
-                "required": ["title", "due_date"],
             },
-        ),
-        Tool(
-            name="dex_update_reminder",
-            description="Update an existing reminder.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "reminder_id": {
-                        "type": "string",
-                        "description": "The UUID of the reminder to update",
-                    },
-                    "title": {
-                        "type": "string",
-                        "description": "New title",
-                    },
-                    "text": {
-                        "type": "string",
-                        "description": "New description text",
-                    },
-                    "due_date": {
-                        "type": "string",
-                        "description": "New due date in YYYY-MM-DD format",
-                    },
-                    "is_complete": {
-                        "type": "boolean",
-                        "description": "Mark as complete or incomplete",
-                    },
+            "required": ["note_ids"],
+        },
+    ),
+    # Reminders
+    Tool(
+        name="dex_list_reminders",
+        description="List all reminders from Dex CRM with pagination. Reminders can be associated with contacts and have due dates.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of reminders to return (default: 10)",
+                    "default": 10,
+                },
+                "offset": {
+                    "type": "integer",
+                    "description": "Number of reminders to skip for pagination (default: 0)",
+                    "default": 0,
                 },
-                "required": ["reminder_id"],
             },
-        ),
-        Tool(
-            name="dex_complete_reminder",
-            description="Mark a reminder as complete.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "reminder_id": {
-                        "type": "string",
-                        "description": "The UUID of the reminder to complete",
-                    },
+        },
+    ),
+    Tool(
+        name="dex_create_reminder",
+        description="Create a new reminder, optionally associated with contacts.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {
+                    "type": "string",
+                    "description": "Reminder title",
+                },
+                "due_date": {
+                    "type": "string",
+                    "description": "Due date in YYYY-MM-DD format",
+                },
+                "contact_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of contact UUIDs to associate with this reminder",
+                },
+                "text": {
+                    "type": "string",
+                    "description": "Additional reminder details",
                 },
-                "required": ["reminder_id"],
             },
-        ),
-        Tool(
-            name="dex_delete_reminder",
-            description="Delete a reminder from Dex CRM.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "reminder_id": {
-                        "type": "string",
-                        "description": "The UUID of the reminder to delete",
+            "required": ["title", "due_date"],
+        },
+    ),
+    Tool(
+        name="dex_update_reminder",
+        description="Update an existing reminder.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "reminder_id": {
+                    "type": "string",
+                    "description": "The UUID of the reminder to update",
+                },
+                "title": {
+                    "type": "string",
+                    "description": "New title",
+                },
+                "text": {
+                    "type": "string",
+                    "description": "New description text",
+                },
+                "due_date": {
+                    "type": "string",
+                    "description": "New due date in YYYY-MM-DD format",
+                },
+                "is_complete": {
+                    "type": "boolean",
+                    "description": "Mark as complete or incomplete",
+                },
+            },
+            "required": ["reminder_id"],
+        },
+    ),
+    Tool(
+        name="dex_complete_reminder",
+        description="Mark a reminder as complete.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "reminder_id": {
+                    "type": "string",
+                    "description": "The UUID of the reminder to complete",
+                },
+            },
+            "required": ["reminder_id"],
+        },
+    ),
+    Tool(
+        name="dex_delete_reminder",
+        description="Delete a reminder from Dex CRM.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "reminder_id": {
+                    "type": "string",
+                    "description": "The UUID of the reminder to delete",
+                },
+            },
+            "required": ["reminder_id"],
+        },
+    ),
+    Tool(
+        name="dex_bulk_delete_reminders",
+        description="Delete several reminders from Dex CRM in one call.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "reminder_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of reminder UUIDs to delete",
+                },
+            },
+            "required": ["reminder_ids"],
+        },
+    ),
+    # Batch
+    Tool(
+        name="dex_bulk",
+        description="Run several independent Dex API requests concurrently. Results are returned in request order; a failed request yields an error entry without affecting the others.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "requests": {
+                    "type": "array",
+                    "description": "List of API requests to issue",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "method": {
+                                "type": "string",
+                                "enum": ["GET", "POST", "PUT", "DELETE"],
+                                "description": "HTTP method",
+                            },
+                            "path": {
+                                "type": "string",
+                                "description": "API path relative to the Dex REST base URL (e.g., '/contacts/{id}')",
+                            },
+                            "params": {
+                                "type": "object",
+                                "description": "Query string parameters",
+                            },
+                            "json": {
+                                "type": "object",
+                                "description": "JSON request body (not allowed for GET)",
+                            },
+                        },
+                        "required": ["method", "path"],
                     },
                 },
-                "required": ["reminder_id"],
             },
-        ),
+            "required": ["requests"],
+        },
+    ),
+]
+
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available Dex CRM tools."""
+    return _TOOLS
+
+
+async def _update_contact(client: DexClient, arguments: dict) -> Any:
+    """Update a contact, passing the remaining arguments as fields."""
+    contact_id = arguments.pop("contact_id")
+    return await client.update_contact(contact_id, **arguments)
+
+
+def _format_http_error(e: httpx.HTTPStatusError | httpx.RequestError) -> str:
+    """Describe an HTTP failure compactly, without the full httpx message."""
+    if isinstance(e, httpx.HTTPStatusError):
+        return f"HTTP {e.response.status_code} on {e.request.url.path}"
+    return f"Network error: {e.__class__.__name__}"
+
+
+def _format_error(e: BaseException) -> str:
+    """Describe a failed batch entry."""
+    if isinstance(e, (httpx.HTTPStatusError, httpx.RequestError)):
+        return _format_http_error(e)
+    return str(e)
+
+
+def _bulk_results(results: list[Any]) -> list[Any]:
+    """Replace failed entries of a batch result with error objects."""
+    return [
+        {"error": _format_error(r)} if isinstance(r, BaseException) else r
+        for r in results
     ]
 
 
-@server.call_tool()
-async def call_tool(name: str, arguments: dict) -> list[TextContent]:
-    """Handle tool calls."""
-    client = get_client()
+async def _bulk(client: DexClient, arguments: dict) -> Any:
+    """Run a batch of requests, reporting failures as error entries."""
+    return _bulk_results(await client.bulk([
+        (r["method"], r["path"], r.get("params"), r.get("json"))
+        for r in arguments["requests"]
+    ]))
 
-    try:
-        # Contacts
-        if name == "dex_list_contacts":
-            result = await client.list_contacts(
-                limit=arguments.get("limit", 10),
-                offset=arguments.get("offset", 0),
-            )
-        elif name == "dex_get_contact":
-            result = await client.get_contact(arguments["contact_id"])
-        elif name == "dex_search_contacts":
-            result = await client.search_contacts_by_email(arguments["email"])
-        elif name == "dex_create_contact":
-            result = await client.create_contact(
-                first_name=arguments["first_name"],
-                last_name=arguments["last_name"],
-                email=arguments.get("email"),
-                phone=arguments.get("phone"),
-                phone_label=arguments.get("phone_label", "Work"),
-                job_title=arguments.get("job_title"),
-                description=arguments.get("description"),
-                linkedin=arguments.get("linkedin"),
-                twitter=arguments.get("twitter"),
-                instagram=arguments.get("instagram"),
-                website=arguments.get("website"),
-            )
-        elif name == "dex_update_contact":
-            contact_id = arguments.pop("contact_id")
-            result = await client.update_contact(contact_id, **arguments)
-        elif name == "dex_delete_contact":
-            result = await client.delete_contact(arguments["contact_id"])
 
-        # Notes
-        elif name == "dex_list_notes":
-            result = await client.list_notes(
-                limit=arguments.get("limit", 10),
-                offset=arguments.get("offset", 0),
-            )
-        elif name == "dex_get_notes_for_contact":
-            result = await client.get_notes_for_contact(arguments["contact_id"])
-        elif name == "dex_create_note":
-            result = await client.create_note(
-                note=arguments["note"],
-                contact_ids=arguments["contact_ids"],
-                event_time=arguments.get("event_time"),
-            )
-        elif name == "dex_update_note":
-            result = await client.update_note(
-                note_id=arguments["note_id"],
-                note=arguments["note"],
-            )
-        elif name == "dex_delete_note":
-            result = await client.delete_note(arguments["note_id"])
+async def _bulk_delete_contacts(client: DexClient, arguments: dict) -> Any:
+    """Delete several contacts, reporting failures as error entries."""
+    return _bulk_results(
+        await client.delete_contacts_bulk(arguments["contact_ids"])
+    )
+
+
+async def _bulk_delete_notes(client: DexClient, arguments: dict) -> Any:
+    """Delete several notes, reporting failures as error entries."""
+    return _bulk_results(await client.delete_notes_bulk(arguments["note_ids"]))
+
+
+async def _bulk_delete_reminders(client: DexClient, arguments: dict) -> Any:
+    """Delete several reminders, reporting failures as error entries."""
+    return _bulk_results(
+        await client.delete_reminders_bulk(arguments["reminder_ids"])
+    )
 
+
+def _build_dispatch(c: DexClient) -> dict[str, Callable[[dict], Awaitable[Any]]]:
+    """Build the tool name -> handler(arguments) table for a client.
+
+    Client methods are bound once here rather than looked up on every call.
+    """
+    return {
+        # Contacts
+        "dex_list_contacts": lambda a, f=c.list_contacts: f(
+            limit=a.get("limit", 10),
+            offset=a.get("offset", 0),
+        ),
+        "dex_get_contact": lambda a, f=c.get_contact: f(a["contact_id"]),
+        "dex_search_contacts": lambda a, f=c.search_contacts_by_email: f(a["email"]),
+        "dex_create_contact": lambda a, f=c.create_contact: f(
+            first_name=a["first_name"],
+            last_name=a["last_name"],
+            email=a.get("email"),
+            phone=a.get("phone"),
+            phone_label=a.get("phone_label", "Work"),
+            job_title=a.get("job_title"),
+            description=a.get("description"),
+            linkedin=a.get("linkedin"),
+            twitter=a.get("twitter"),
+            instagram=a.get("instagram"),
+            website=a.get("website"),
+        ),
+        "dex_update_contact": partial(_update_contact, c),
+        "dex_delete_contact": lambda a, f=c.delete_contact: f(a["contact_id"]),
+        "dex_bulk_delete_contacts": partial(_bulk_delete_contacts, c),
+        # Notes
+        "dex_list_notes": lambda a, f=c.list_notes: f(
+            limit=a.get("limit", 10),
+            offset=a.get("offset", 0),
+        ),
+        "dex_get_notes_for_contact": lambda a, f=c.get_notes_for_contact: f(
+            a["contact_id"]
+        ),
+        "dex_create_note": lambda a, f=c.create_note: f(
+            note=a["note"],
+            contact_ids=a["contact_ids"],
+            event_time=a.get("event_time"),
+        ),
+        "dex_update_note": lambda a, f=c.update_note: f(
+            note_id=a["note_id"],
+            note=a["note"],
+        ),
+        "dex_delete_note": lambda a, f=c.delete_note: f(a["note_id"]),
+        "dex_bulk_delete_notes": partial(_bulk_delete_notes, c),
         # Reminders
-        elif name == "dex_list_reminders":
-            result = await client.list_reminders(
-                limit=arguments.get("limit", 10),
-                offset=arguments.get("offset", 0),
-            )
-        elif name == "dex_create_reminder":
-            result = await client.create_reminder(
-                title=arguments["title"],
-                due_date=arguments["due_date"],
-                contact_ids=arguments.get("contact_ids"),
-                text=arguments.get("text"),
-            )
-        elif name == "dex_update_reminder":
-            result = await client.update_reminder(
-                reminder_id=arguments["reminder_id"],
-                title=arguments.get("title"),
-                text=arguments.get("text"),
-                due_date=arguments.get("due_date"),
-                is_complete=arguments.get("is_complete"),
-            )
-        elif name == "dex_complete_reminder":
-            result = await client.complete_reminder(arguments["reminder_id"])
-        elif name == "dex_delete_reminder":
-            result = await client.delete_reminder(arguments["reminder_id"])
+        "dex_list_reminders": lambda a, f=c.list_reminders: f(
+            limit=a.get("limit", 10),
+            offset=a.get("offset", 0),
+        ),
+        "dex_create_reminder": lambda a, f=c.create_reminder: f(
+            title=a["title"],
+            due_date=a["due_date"],
+            contact_ids=a.get("contact_ids"),
+            text=a.get("text"),
+        ),
+        "dex_update_reminder": lambda a, f=c.update_reminder: f(
+            reminder_id=a["reminder_id"],
+            title=a.get("title"),
+            text=a.get("text"),
+            due_date=a.get("due_date"),
+            is_complete=a.get("is_complete"),
+        ),
+        "dex_complete_reminder": lambda a, f=c.complete_reminder: f(a["reminder_id"]),
+        "dex_delete_reminder": lambda a, f=c.delete_reminder: f(a["reminder_id"]),
+        "dex_bulk_delete_reminders": partial(_bulk_delete_reminders, c),
+        # Batch
+        "dex_bulk": partial(_bulk, c),
+    }
+
+
+def get_dispatch() -> dict[str, Callable[[dict], Awaitable[Any]]]:
+    """Get or create the dispatch table bound to the Dex client."""
+    global _dispatch
+    if _dispatch is None:
+        _dispatch = _build_dispatch(get_client())
+    return _dispatch
 
-        else:
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
 
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+@server.call_tool()
+async def call_tool(name: str, arguments: dict) -> list[TextContent]:
+    """Handle tool calls."""
+    handler = get_dispatch().get(name)
+    if handler is None:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+
+    try:
+        result = await handler(arguments)
+        text = orjson.dumps(
+            result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+        return [TextContent(type="text", text=text)]
 
-    except Exception as e:
-        return [TextContent(type="text", text=f"Error: {str(e)}")]
+    except (httpx.HTTPStatusError, httpx.RequestError) as e:
+        return [TextContent(type="text", text=_format_http_error(e))]
 
 
 async def run_server():
     """Run the MCP server."""
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, server.create_initialization_options())
+    global _client, _dispatch
+    warmup: asyncio.Task | None = None
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            # Preheat the pool in the background so it never delays initialize
+            if os.environ.get("DEX_API_KEY"):
+                warmup = asyncio.create_task(get_client().warmup())
+            await server.run(read_stream, write_stream, server.create_initialization_options())
+    finally:
+        if warmup is not None and not warmup.done():
+            warmup.cancel()
+            try:
+                await warmup
+            except asyncio.CancelledError:
+                pass
+        if _client is not None:
+            await _client.close()
+            _client = None
+            _dispatch = None
 
 
 def main():
     """Main entry point."""
-    import asyncio
-    asyncio.run(run_server())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(run_server())
+    else:
+        uvloop.run(run_server())
 
 
 if __name__ == "__main__":